@@ -3,22 +3,23 @@ core/cache.py
 
 In-memory LRU cache for research results.
 
-Cache key: sha256(query + canonical params)
+Cache key: blake2b-128(normalised query + canonical params)
 TTL: configurable, default 1 hour.
+Queries whose search found nothing are remembered in a short-lived
+negative cache so they do not hit DDG again right away.
 
 Environment variables:
-  CACHE_TTL_MEM    In-memory TTL in seconds  (default: 3600)
-  CACHE_MAX_SIZE   Max in-memory entries      (default: 128)
+  CACHE_TTL_MEM       In-memory TTL in seconds      (default: 3600)
+  CACHE_MAX_SIZE      Max in-memory entries          (default: 128)
+  CACHE_TTL_NEGATIVE  Negative-entry TTL in seconds  (default: 300)
 """
 from __future__ import annotations
 
-import asyncio
 import hashlib
 import json
 import logging
 import os
 import time
-from collections import OrderedDict
 from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
@@ -29,16 +30,28 @@ logger = logging.getLogger(__name__)
 
 CACHE_TTL_MEM  = int(os.getenv("CACHE_TTL_MEM",  "3600"))
 CACHE_MAX_SIZE = int(os.getenv("CACHE_MAX_SIZE", "128"))
+CACHE_TTL_NEGATIVE = int(os.getenv("CACHE_TTL_NEGATIVE", "300"))
 
 
 # ---------------------------------------------------------------------------
 # Cache key builder
 # ---------------------------------------------------------------------------
 
+# One reusable compact encoder: json.dumps would rebuild it on every call
+_KEY_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace: '  Python  GIL ' → 'python gil'."""
+    return " ".join(query.lower().split())
+
+
 def make_cache_key(query: str, **params: Any) -> str:
-    """Return a stable hex key for (query, params)."""
-    payload = json.dumps({"query": query, **params}, sort_keys=True)
-    return hashlib.sha256(payload.encode()).hexdigest()
+    """Return a stable hex key for (normalised query, params)."""
+    payload = _KEY_ENCODER.encode({"query": normalize_query(query), **params})
+    # Keys never leave the process: a 128-bit blake2b digest is ample and
+    # cheaper to compute than sha256
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
 
 
 # ---------------------------------------------------------------------------
@@ -46,41 +59,43 @@ def make_cache_key(query: str, **params: Any) -> str:
 # ---------------------------------------------------------------------------
 
 class _LRUCache:
-    """Thread-safe LRU cache with per-entry TTL."""
+    """
+    LRU cache with per-entry TTL, shared by tasks on one event loop.
+
+    Recency is the insertion order of a plain dict: a hit re-inserts its
+    key at the end and eviction removes the first key.  No method awaits
+    mid-update, so each operation is atomic on the event loop and needs
+    no lock.  Methods stay async to keep the cache interface stable.
+    """
 
     def __init__(self, max_size: int, ttl: int) -> None:
         self._max_size = max_size
         self._ttl = ttl
-        self._store: OrderedDict[str, tuple[Any, float]] = OrderedDict()
-        self._lock = asyncio.Lock()
+        self._store: dict[str, tuple[Any, float]] = {}
 
     async def get(self, key: str) -> Optional[Any]:
-        async with self._lock:
-            if key not in self._store:
-                return None
-            value, expires_at = self._store[key]
-            if time.monotonic() > expires_at:
-                del self._store[key]
-                return None
-            # Move to end (most recently used)
-            self._store.move_to_end(key)
-            return value
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if time.monotonic() > expires_at:
+            self._store.pop(key, None)
+            return None
+        # Re-insert at the end (most recently used)
+        self._store[key] = self._store.pop(key)
+        return value
 
     async def set(self, key: str, value: Any) -> None:
-        async with self._lock:
-            if key in self._store:
-                self._store.move_to_end(key)
-            self._store[key] = (value, time.monotonic() + self._ttl)
-            if len(self._store) > self._max_size:
-                self._store.popitem(last=False)  # evict oldest
+        self._store.pop(key, None)
+        self._store[key] = (value, time.monotonic() + self._ttl)
+        if len(self._store) > self._max_size:
+            del self._store[next(iter(self._store))]  # evict oldest
 
     async def delete(self, key: str) -> None:
-        async with self._lock:
-            self._store.pop(key, None)
+        self._store.pop(key, None)
 
     async def clear(self) -> None:
-        async with self._lock:
-            self._store.clear()
+        self._store.clear()
 
     @property
     def size(self) -> int:
@@ -92,10 +107,11 @@ class _LRUCache:
 # ---------------------------------------------------------------------------
 
 class ResearchCache:
-    """In-memory LRU cache for research results."""
+    """In-memory LRU cache for research results, plus a negative cache."""
 
     def __init__(self) -> None:
         self._mem = _LRUCache(CACHE_MAX_SIZE, CACHE_TTL_MEM)
+        self._negative = _LRUCache(CACHE_MAX_SIZE, CACHE_TTL_NEGATIVE)
 
     async def get(self, key: str) -> Optional[Any]:
         value = await self._mem.get(key)
@@ -111,8 +127,16 @@ class ResearchCache:
     async def delete(self, key: str) -> None:
         await self._mem.delete(key)
 
+    async def get_negative(self, key: str) -> bool:
+        """True if *key* recently produced no search results."""
+        return await self._negative.get(key) is not None
+
+    async def set_negative(self, key: str) -> None:
+        await self._negative.set(key, True)
+
     async def clear(self) -> None:
         await self._mem.clear()
+        await self._negative.clear()
 
     @property
     def memory_size(self) -> int:
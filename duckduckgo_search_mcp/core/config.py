@@ -2,14 +2,17 @@
 core/config.py
 
 Shared dataclasses: ResearchConfig, FetchResult, ResearchStats.
+Validated tool-argument models: SearchArgs, FetchArgs, ResearchArgs.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Literal, Optional
 
+from pydantic import BaseModel, ConfigDict, ValidationError
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ResearchConfig:
     """All tunable parameters for a research run (maps 1-to-1 to MCP tool input schema)."""
     query: str
@@ -22,7 +25,7 @@ class ResearchConfig:
     output_format: str = "json"     # json | raw | markdown
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FetchResult:
     """Result for a single fetched URL."""
     url: str
@@ -33,16 +36,16 @@ class FetchResult:
     source: str = "direct"
 
     def to_dict(self) -> dict:
-        d: dict = {"url": self.url, "success": self.success, "source": self.source}
+        # One dict literal per shape — no incremental inserts
         if self.success:
-            d["title"] = self.title
-            d["content"] = self.content
-        else:
-            d["error"] = self.error
-        return d
+            return {
+                "url": self.url, "success": True, "source": self.source,
+                "title": self.title, "content": self.content,
+            }
+        return {"url": self.url, "success": False, "source": self.source, "error": self.error}
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchStats:
     """Counters accumulated during a research run."""
     query: str = ""
@@ -50,6 +53,7 @@ class ResearchStats:
     urls_fetched: int = 0
     urls_failed: int = 0
     content_chars: int = 0
+    search_failed: bool = False     # DDG raised; internal, not reported
 
     def to_dict(self) -> dict:
         return {
@@ -59,3 +63,47 @@ class ResearchStats:
             "urls_failed": self.urls_failed,
             "content_chars": self.content_chars,
         }
+
+
+# ---------------------------------------------------------------------------
+# Tool arguments: each model coerces and validates a whole arguments dict in
+# one pass; unknown keys are rejected rather than silently ignored
+# ---------------------------------------------------------------------------
+
+class SearchArgs(BaseModel):
+    """search_web tool arguments."""
+    model_config = ConfigDict(extra="forbid")
+
+    query: str = ""
+    num_results: int = 50
+
+
+class FetchArgs(BaseModel):
+    """fetch_page tool arguments."""
+    model_config = ConfigDict(extra="forbid")
+
+    url: str = ""
+    max_length: int = 5000
+    timeout: int = 20
+
+
+class ResearchArgs(BaseModel):
+    """research tool arguments."""
+    model_config = ConfigDict(extra="forbid")
+
+    query: str = ""
+    search_results: int = 50
+    fetch_count: int = 0
+    max_content_length: int = 5000
+    timeout: int = 20
+    max_concurrent: int = 20
+    output_format: Literal["json", "raw", "markdown"] = "json"
+    use_cache: bool = True
+
+
+def invalid_arguments(exc: ValidationError) -> dict:
+    """Tool error response listing each invalid field."""
+    return {
+        "error": "Invalid arguments",
+        "details": exc.errors(include_url=False, include_context=False, include_input=False),
+    }
@@ -2,14 +2,20 @@
 core/ddg.py
 
 DuckDuckGo search wrapper with early URL filtering and deduplication.
-Runs synchronously (DDGS is sync) but is bridged to async via
-ThreadPoolExecutor in the pipeline.
+DDGS is synchronous and returns complete result lists; search_async() runs
+it in the default executor and drains the filtered pairs to the event loop
+through a queue.  Each worker thread reuses one DDGS, and with it the
+engines' HTTP connections.
 """
 from __future__ import annotations
 
-import urllib.parse
+import asyncio
+import hashlib
 import logging
-from typing import Iterator, Set, Tuple
+import math
+import threading
+import urllib.parse
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
 
 from ddgs import DDGS
 
@@ -17,13 +23,86 @@ from .filters import get_filter_config
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# DDGS caches its engine clients (and their keep-alive connections) per
+# instance, but makes no thread-safety promises: keep one per thread.
+# Executor threads are long-lived, so repeat searches reuse connections.
+_thread_local = threading.local()
+
+
+def _get_ddgs() -> DDGS:
+    ddgs = getattr(_thread_local, "ddgs", None)
+    if ddgs is None:
+        ddgs = _thread_local.ddgs = DDGS(verify=False)
+    return ddgs
+
 
 def _is_valid_url(url: str) -> bool:
-    try:
-        r = urllib.parse.urlparse(url)
-        return r.scheme in ("http", "https") and bool(r.netloc)
-    except Exception:
+    """Cheap check for an http(s) URL with a dotted host; cannot raise."""
+    if not url.startswith(("http://", "https://")):
         return False
+    host = url.split("://", 1)[1].split("/", 1)[0]
+    return bool(host) and "." in host
+
+
+def _canonicalize(url: str) -> str:
+    """
+    Return a normalised form of *url* for deduplication.
+
+    Lowercases scheme and host, strips default ports, the fragment and
+    trailing slashes, and sorts query parameters.
+    """
+    try:
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        host = parts.hostname or ""
+        port = parts.port
+    except ValueError:
+        return url
+    if ":" in host:
+        host = f"[{host}]"  # IPv6 literal
+    if port is not None and port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+    query = urllib.parse.urlencode(
+        sorted(urllib.parse.parse_qsl(parts.query, keep_blank_values=True))
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urllib.parse.urlunsplit((scheme, host, path, query, ""))
+
+
+class _BloomFilter:
+    """
+    Compact probabilistic set used for per-search URL deduplication.
+
+    Bit indexes are derived from one blake2b digest via Kirsch–Mitzenmacher
+    double hashing (h1 + i·h2 mod m).  Never reports a seen item as new;
+    reports a new item as seen with probability ≈ *error_rate*.
+    """
+
+    __slots__ = ("_bits", "_size", "_hashes")
+
+    def __init__(self, capacity: int, error_rate: float = 1e-4) -> None:
+        capacity = max(1, capacity)
+        self._size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def _indexes(self, item: str) -> List[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self._size
+        return [(h1 + i * h2) % size for i in range(self._hashes)]
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[i >> 3] & (1 << (i & 7)) for i in self._indexes(item))
+
+    def add(self, item: str) -> None:
+        bits = self._bits
+        for i in self._indexes(item):
+            bits[i >> 3] |= 1 << (i & 7)
 
 
 class DuckDuckGoSearch:
@@ -38,30 +117,73 @@ class DuckDuckGoSearch:
         self,
         query: str,
         num_results: int = 50,
+        raise_errors: bool = False,
     ) -> Iterator[Tuple[str, str]]:
         """
         Yield up to *num_results* (url, title) pairs from DuckDuckGo.
 
         Requests 2× from DDG to compensate for filtered/duplicate URLs.
+        Deduplication keys on the canonical URL; the original is yielded.
+        DDG errors (rate limits, network) are logged and end the results;
+        pass *raise_errors* to have them re-raised after logging, so callers
+        can tell a failed search from one that found nothing.
         """
-        filters = get_filter_config()
-        seen_urls: Set[str] = set()
+        # Snapshot the bound method: one lookup per search, not per result
+        is_blocked_url = get_filter_config().is_blocked_url
+        seen_urls = _BloomFilter(capacity=num_results * 4, error_rate=1e-4)
         count = 0
 
         try:
-            ddg = DDGS(verify=False)
-            for r in ddg.text(query, max_results=num_results * 2):
+            for r in _get_ddgs().text(query, max_results=num_results * 2):
                 url = r.get("href", "")
-                if (
-                    url
-                    and url not in seen_urls
-                    and _is_valid_url(url)
-                    and not filters.is_blocked_url(url)
-                ):
-                    seen_urls.add(url)
+                if not url or not _is_valid_url(url):
+                    continue
+                key = _canonicalize(url)
+                if key not in seen_urls and not is_blocked_url(url):
+                    seen_urls.add(key)
                     yield url, r.get("title", "")
                     count += 1
                     if count >= num_results:
                         return
         except Exception as exc:
             logger.warning("DDG search error for %r: %s", query, exc)
+            if raise_errors:
+                raise
+
+    async def search_async(
+        self,
+        query: str,
+        num_results: int = 50,
+        raise_errors: bool = False,
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Async variant of search() that keeps the event loop free.
+
+        DDGS.text() blocks until it has built its complete result list, so
+        the whole search runs in the default executor.  The worker filters
+        and dedups that list and drains the pairs into an asyncio.Queue;
+        callers consume them as they are queued, and stopping early ends
+        the drain.  With *raise_errors*, a DDG error is re-raised here
+        once the queued pairs have been yielded.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[Optional[Tuple[str, str]]] = asyncio.Queue()
+        stop = threading.Event()
+
+        def _drain() -> None:
+            try:
+                for pair in self.search(query, num_results, raise_errors):
+                    if stop.is_set():
+                        return
+                    loop.call_soon_threadsafe(queue.put_nowait, pair)
+            finally:
+                if not stop.is_set():
+                    loop.call_soon_threadsafe(queue.put_nowait, None)
+
+        worker = loop.run_in_executor(None, _drain)
+        try:
+            while (pair := await queue.get()) is not None:
+                yield pair
+            await worker
+        finally:
+            stop.set()
@@ -3,34 +3,52 @@ core/extractor.py
 
 HTML → clean readable text extraction.
 All regex patterns are compiled once at module import.
+Fetched page bodies are memoised by a digest of the raw bytes.
 """
 from __future__ import annotations
 
+import hashlib
 import re
 from html import unescape
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
-from .filters import get_filter_config
+from .filters import FilterConfig, get_filter_config
 
 # ---------------------------------------------------------------------------
 # Compiled regex patterns
 # ---------------------------------------------------------------------------
 
-RE_STRIP_TAGS   = re.compile(
-    r"<(script|style|nav|footer|header|aside|noscript)[^>]*>.*?</\1>",
+# Noise tags and comments in one pass; leftmost match wins, so a comment
+# that merely contains "<script>" is dropped whole
+RE_NOISE        = re.compile(
+    r"<!--.*?-->|<(script|style|nav|footer|header|aside|noscript)[^>]*>.*?</\1>",
     re.DOTALL | re.IGNORECASE,
 )
-RE_COMMENTS     = re.compile(r"<!--.*?-->", re.DOTALL)
 RE_TITLE        = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
 RE_BR           = re.compile(r"<br\s*/?>", re.IGNORECASE)
 RE_BLOCK_END    = re.compile(r"</(p|div|h[1-6]|li|tr|article|section)>", re.IGNORECASE)
 RE_LI           = re.compile(r"<li[^>]*>", re.IGNORECASE)
 RE_ALL_TAGS     = re.compile(r"<[^>]+>")
 RE_SPACES       = re.compile(r"[ \t]+")
-RE_LEADING_SP   = re.compile(r"\n[ \t]+")
-RE_MULTI_NL     = re.compile(r"\n{3,}")
 RE_WHITESPACE   = re.compile(r"\s+")
 RE_SITE_SUFFIX  = re.compile(r'\s*[\|\-–—]\s*[^|\-–—]{3,50}$')
+SITE_SEPARATORS = frozenset("|-–—")  # RE_SITE_SUFFIX cannot match without one
+
+BULLET_CHARS    = "•·●○◦‣⁃"
+
+# ---------------------------------------------------------------------------
+# Memoisation: (blake2b-64(body), encoding) → extracted text, LRU in dict
+# order, bounded by entry count and by total characters held.
+# Output depends on the navigation patterns, so the memo is dropped
+# whenever the shared FilterConfig is replaced.
+# ---------------------------------------------------------------------------
+
+EXTRACT_CACHE_SIZE = 256
+EXTRACT_CACHE_MAX_CHARS = 8_000_000
+
+_extract_cache: Dict[Tuple[bytes, str], str] = {}
+_extract_cache_chars = 0
+_extract_cache_filters: Optional[FilterConfig] = None
 
 
 # ---------------------------------------------------------------------------
@@ -57,6 +75,43 @@ def extract_title_from_content(content: str) -> str:
 
 
 def extract_text(html: str) -> str:
+    """Extract readable text from an HTML page (see _extract_text)."""
+    return _extract_text(html, get_filter_config())
+
+
+def extract_page(body: bytes | bytearray, encoding: str) -> str:
+    """
+    Decode a fetched page body and extract its text (memoised).
+
+    The same page is commonly re-fetched when different queries hit the
+    same URL; hashing the raw body then replaces decoding and the whole
+    regex pipeline.
+    """
+    global _extract_cache_filters, _extract_cache_chars
+    filters = get_filter_config()
+    if filters is not _extract_cache_filters:
+        _extract_cache.clear()
+        _extract_cache_chars = 0
+        _extract_cache_filters = filters
+
+    key = (hashlib.blake2b(body, digest_size=8).digest(), encoding)
+    text = _extract_cache.pop(key, None)
+    if text is None:
+        text = _extract_text(body.decode(encoding, errors="replace"), filters)
+        if len(text) > EXTRACT_CACHE_MAX_CHARS:
+            return text
+        _extract_cache_chars += len(text)
+        while _extract_cache and (
+            len(_extract_cache) >= EXTRACT_CACHE_SIZE
+            or _extract_cache_chars > EXTRACT_CACHE_MAX_CHARS
+        ):
+            evicted = _extract_cache.pop(next(iter(_extract_cache)))  # oldest
+            _extract_cache_chars -= len(evicted)
+    _extract_cache[key] = text  # (re-)insert as most recent
+    return text
+
+
+def _extract_text(html: str, filters: FilterConfig) -> str:
     """
     Extract readable text from an HTML page.
 
@@ -70,11 +125,8 @@ def extract_text(html: str) -> str:
          short-line collapsing)
       7. Prepend "# {title}" if a title was found
     """
-    filters = get_filter_config()
-
-    # Stage 1-2: structural noise removal
-    html = RE_STRIP_TAGS.sub("", html)
-    html = RE_COMMENTS.sub("", html)
+    # Stage 1-2: structural noise removal (single fused pass)
+    html = RE_NOISE.sub("", html)
 
     # Stage 3: title extraction
     title_match = RE_TITLE.search(html)
@@ -89,15 +141,19 @@ def extract_text(html: str) -> str:
     # Stage 5: strip tags, normalise
     text = RE_ALL_TAGS.sub(" ", html)
     text = unescape(text)
+    # Leading spaces and blank-line runs need no passes of their own:
+    # stage 6 strips every line and drops empty ones
     text = RE_SPACES.sub(" ", text)
-    text = RE_LEADING_SP.sub("\n", text)
-    text = RE_MULTI_NL.sub("\n\n", text)
 
     # Stage 6: line-level filter
     lines: List[str] = []
     short_buffer: List[str] = []
     prev_line = ""
     title_seen = False
+    # Hoisted lookups for the per-line loop
+    is_nav = filters.is_navigation_line
+    isalnum = str.isalnum
+    site_sub = RE_SITE_SUFFIX.sub
 
     for line in text.split("\n"):
         line = line.strip()
@@ -105,16 +161,17 @@ def extract_text(html: str) -> str:
             continue
 
         # Navigation lines
-        if filters.is_navigation_line(line):
+        if is_nav(line):
             continue
 
         # Symbol-heavy lines (nav remnants)
-        alnum_count = sum(1 for c in line if c.isalnum())
+        # Counters below run as C builtins (map/str.count), not per-char Python loops
+        alnum_count = sum(map(isalnum, line))
         if len(line) > 3 and alnum_count / len(line) < 0.3:
             continue
 
         # Excessive bullet characters
-        bullet_count = sum(1 for c in line if c in "•·●○◦‣⁃")
+        bullet_count = sum(map(line.count, BULLET_CHARS))
         if bullet_count >= 4:
             continue
 
@@ -129,15 +186,17 @@ def extract_text(html: str) -> str:
 
         # Duplicate title line
         if title and not title_seen:
-            line_norm = RE_SITE_SUFFIX.sub("", line)
-            if line_norm == title or line == raw_title:
+            if line == raw_title or (
+                line == title if SITE_SEPARATORS.isdisjoint(line)
+                else site_sub("", line) == title
+            ):
                 title_seen = True
                 continue
 
         # Single/double-word UI fragments
         words = line.split()
         if len(line) < 15 and len(words) <= 2 and not line.startswith("#"):
-            if not any(c.islower() for c in line):
+            if not any(map(str.islower, line)):  # no lowercase letters
                 continue
 
         # Collapse runs of short lines
@@ -165,7 +224,8 @@ def extract_text(html: str) -> str:
         else:
             lines.append(" | ".join(short_buffer))
 
-    text = RE_MULTI_NL.sub("\n\n", "\n".join(lines)).strip()
+    # Kept lines are stripped and non-empty, so the join needs no cleanup
+    text = "\n".join(lines)
 
     if title:
         text = f"# {title}\n\n{text}"
@@ -3,14 +3,16 @@ core/fetcher.py
 
 Async HTTP/2 page fetcher with:
   - SSL verification disabled for reliability
-  - CAPTCHA/block detection
-  - Content-length guard (2 MB hard cap)
-  - User-agent rotation (one UA per session)
+  - CAPTCHA/block detection on the first bytes of the body (early abort)
+  - Streamed body read with a 2 MB hard cap, decoded once
+  - User-agent rotation (round-robin, one UA per session)
   - Structured FetchResult output (never raises)
 """
 from __future__ import annotations
 
-import random
+import asyncio
+import contextlib
+import itertools
 import ssl
 import logging
 from typing import Optional, Tuple
@@ -18,8 +20,8 @@ from typing import Optional, Tuple
 import httpx
 
 from .config import FetchResult
-from .extractor import extract_text, extract_title_from_content
-from .filters import get_filter_config
+from .extractor import extract_page, extract_title_from_content
+from .filters import CONTENT_SCAN_BYTES, get_filter_config
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +30,10 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 MAX_CONTENT_BYTES = 2_000_000  # 2 MB hard cap
+READ_CHUNK_BYTES  = 65_536     # streaming read size
+
+# Decoders for all of these ship with httpx's brotli/zstd extras
+ACCEPT_ENCODING = "br, zstd, gzip, deflate"
 
 USER_AGENTS: Tuple[str, ...] = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/122.0.0.0 Safari/537.36",
@@ -36,6 +42,9 @@ USER_AGENTS: Tuple[str, ...] = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 Safari/605.1.15",
 )
 
+# next() on itertools.count is atomic under the GIL — no lock needed
+_UA_COUNTER = itertools.count()
+
 # ---------------------------------------------------------------------------
 # SSL context singleton
 # ---------------------------------------------------------------------------
@@ -57,7 +66,8 @@ def _get_ssl_context() -> ssl.SSLContext:
 # ---------------------------------------------------------------------------
 
 def get_random_user_agent() -> str:
-    return random.choice(USER_AGENTS)
+    """Return the next user agent in round-robin order."""
+    return USER_AGENTS[next(_UA_COUNTER) % len(USER_AGENTS)]
 
 
 def _make_fetch_result(
@@ -69,6 +79,8 @@ def _make_fetch_result(
 ) -> FetchResult:
     """Validate length, truncate, and build a successful FetchResult."""
     if content and len(content) >= min_length:
+        # Truncate first: the title scan stops at the first newline and
+        # can then never run past max_length
         if len(content) > max_length:
             content = content[:max_length] + "\n\n[Truncated...]"
         return FetchResult(
@@ -92,41 +104,61 @@ async def fetch_single_async(
     min_content_length: int,
     max_content_length: int,
     user_agent: str = "",
+    body_semaphore: Optional[asyncio.Semaphore] = None,
 ) -> FetchResult:
     """
     Fetch a single URL and return a FetchResult.
 
+    If *body_semaphore* is given, it is held only while the body is read,
+    decoded and extracted, so at most that many bodies are in memory at
+    once while requests themselves can still be in flight.
+
     Never raises — all errors are captured in FetchResult.error.
     """
-    filters = get_filter_config()
+    is_blocked_content = get_filter_config().is_blocked_content_bytes
     ua = user_agent or get_random_user_agent()
 
     try:
-        resp = await client.get(
+        async with client.stream(
+            "GET",
             url,
             headers={
                 "User-Agent": ua,
                 "Accept": "text/html,application/xhtml+xml",
+                "Accept-Encoding": ACCEPT_ENCODING,
             },
             timeout=timeout,
             follow_redirects=True,
-        )
-
-        if resp.status_code != 200:
-            return FetchResult(url=url, success=False, error=f"HTTP {resp.status_code}")
-
-        # Size guard (header-based, free check)
-        cl = resp.headers.get("content-length")
-        if cl and int(cl) > MAX_CONTENT_BYTES:
-            return FetchResult(url=url, success=False, error="Content too large")
-
-        raw = resp.text
-
-        # CAPTCHA / bot-block detection
-        if filters.is_blocked_content(raw):
-            return FetchResult(url=url, success=False, error="CAPTCHA/blocked")
+        ) as resp:
+            if resp.status_code != 200:
+                return FetchResult(url=url, success=False, error=f"HTTP {resp.status_code}")
+
+            # Size guard (header-based, free check)
+            cl = resp.headers.get("content-length")
+            if cl and int(cl) > MAX_CONTENT_BYTES:
+                return FetchResult(url=url, success=False, error="Content too large")
+
+            encoding = resp.encoding or "utf-8"
+            async with body_semaphore or contextlib.nullcontext():
+                buf = bytearray()
+                prefix_checked = False
+                # aiter_bytes yields decompressed data, so the cap applies to the page itself
+                async for chunk in resp.aiter_bytes(READ_CHUNK_BYTES):
+                    buf += chunk
+                    # CAPTCHA / bot-block detection on the prefix, before reading the rest
+                    if not prefix_checked and len(buf) >= CONTENT_SCAN_BYTES:
+                        prefix_checked = True
+                        if is_blocked_content(buf):
+                            return FetchResult(url=url, success=False, error="CAPTCHA/blocked")
+                    if len(buf) >= MAX_CONTENT_BYTES:
+                        del buf[MAX_CONTENT_BYTES:]
+                        break
+
+                if not prefix_checked and is_blocked_content(buf):
+                    return FetchResult(url=url, success=False, error="CAPTCHA/blocked")
+
+                content = extract_page(buf, encoding)
 
-        content = extract_text(raw)
         return _make_fetch_result(url, content, "direct", min_content_length, max_content_length)
 
     except httpx.TimeoutException:
@@ -143,16 +175,24 @@ async def fetch_single_async(
 # Shared async client factory
 # ---------------------------------------------------------------------------
 
+SHARED_CLIENT_MAX_CONNECTIONS = 100
+SHARED_CLIENT_MAX_BODIES      = 20   # bodies materialised at once across tool calls
+
+_SHARED_CLIENT: Optional[httpx.AsyncClient] = None
+_SHARED_BODY_SEMAPHORE: Optional[asyncio.Semaphore] = None
+
+
 def build_http_client(max_concurrent: int, timeout: int) -> httpx.AsyncClient:
     """
     Build an httpx.AsyncClient tuned for parallel HTTP/2 fetching.
 
-    Use as an async context manager:
+    All clients share one prebuilt SSL context instead of each building
+    its own.  Use as an async context manager:
         async with build_http_client(...) as client:
             ...
     """
     return httpx.AsyncClient(
-        verify=False,
+        verify=_get_ssl_context(),
         http2=True,
         limits=httpx.Limits(
             max_connections=max_concurrent,
@@ -161,3 +201,34 @@ def build_http_client(max_concurrent: int, timeout: int) -> httpx.AsyncClient:
         ),
         timeout=httpx.Timeout(timeout, connect=5.0),
     )
+
+
+def get_shared_client(timeout: int = 20) -> httpx.AsyncClient:
+    """
+    Return the process-wide client used for one-off fetches.
+
+    Built lazily on first use and kept open so connections and TLS
+    sessions are reused across tool calls.  *timeout* only applies to
+    the first call; per-request timeouts are passed to fetch_single_async.
+    """
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+        _SHARED_CLIENT = build_http_client(SHARED_CLIENT_MAX_CONNECTIONS, timeout)
+    return _SHARED_CLIENT
+
+
+def get_shared_body_semaphore() -> asyncio.Semaphore:
+    """Return the semaphore bounding concurrent body reads on the shared client."""
+    global _SHARED_BODY_SEMAPHORE
+    if _SHARED_BODY_SEMAPHORE is None:
+        _SHARED_BODY_SEMAPHORE = asyncio.Semaphore(SHARED_CLIENT_MAX_BODIES)
+    return _SHARED_BODY_SEMAPHORE
+
+
+async def close_shared_client() -> None:
+    """Close the process-wide client, if it was ever built."""
+    global _SHARED_CLIENT, _SHARED_BODY_SEMAPHORE
+    _SHARED_BODY_SEMAPHORE = None
+    if _SHARED_CLIENT is not None:
+        await _SHARED_CLIENT.aclose()
+        _SHARED_CLIENT = None
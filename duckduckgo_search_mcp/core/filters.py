@@ -47,14 +47,34 @@ DEFAULT_BLOCKED_CONTENT_MARKERS: Tuple[str, ...] = (
     "blocked by",
 )
 
+# Raw-body prefix scanned by is_blocked_content_bytes
+CONTENT_SCAN_BYTES = 8_192
+
+# Common spellings of the markers that match most blocked pages.  Found with
+# bytes.find on the raw body before the lowercased general scan; only used
+# while the marker itself is configured.
+_FAST_MARKER_VARIANTS: dict[str, Tuple[bytes, ...]] = {
+    "captcha": (b"captcha", b"CAPTCHA", b"Captcha"),
+    "cloudflare ray id:": (b"Cloudflare Ray ID:", b"cloudflare ray id:"),
+}
+
 DEFAULT_NAVIGATION_PATTERNS: Tuple[str, ...] = (
     "skip to",
     "jump to",
 )
 
 
+def _url_host(url: str) -> str:
+    """Host part of *url* without userinfo or port; cannot raise."""
+    start = url.find("://")
+    netloc = url[start + 3:] if start != -1 else url
+    for sep in "/?#":
+        netloc = netloc.partition(sep)[0]
+    return netloc.rpartition("@")[2].partition(":")[0]
+
+
 # ---------------------------------------------------------------------------
-# FilterConfig — mutable, MCP-resource-backed
+# FilterConfig — MCP-resource-backed, replaced rather than mutated
 # ---------------------------------------------------------------------------
 
 @dataclass
@@ -62,9 +82,11 @@ class FilterConfig:
     """
     Runtime-configurable filter lists.
 
-    Instances are mutated when the MCP client writes the filter Resource,
-    so all consumers must reference the same shared instance (see
-    web_search_mcp/state.py).
+    The shared instance is never mutated: a filter Resource write builds a
+    new one with dataclasses.replace() and publishes it through
+    set_filter_config().  Consumers cache derived data (extracted text,
+    serialised Resource payloads) per instance, so mutating the lists of
+    the shared instance in place would leave those caches stale.
     """
     blocked_domains: list[str] = field(
         default_factory=lambda: list(DEFAULT_BLOCKED_DOMAINS)
@@ -79,28 +101,98 @@ class FilterConfig:
         default_factory=lambda: list(DEFAULT_NAVIGATION_PATTERNS)
     )
 
-    # Compiled regex — rebuilt whenever lists change
+    # Compiled matchers — rebuilt whenever lists change
+    _blocked_hosts: frozenset[str] = field(default=frozenset(), repr=False, compare=False)
     _compiled_url_pattern: re.Pattern | None = field(default=None, repr=False, compare=False)
-
-    def rebuild_url_pattern(self) -> None:
-        """(Re)compile the combined URL-block regex from current lists."""
-        domain_part = "|".join(re.escape(d) for d in self.blocked_domains)
-        pattern_part = "|".join(self.skip_url_patterns)
-        combined = f"(?:{domain_part})|(?:{pattern_part})" if domain_part and pattern_part \
-            else domain_part or pattern_part or "(?!)"
-        self._compiled_url_pattern = re.compile(combined, re.IGNORECASE)
+    _compiled_url_pattern_ci: re.Pattern | None = field(default=None, repr=False, compare=False)
+    _content_markers: Tuple[str, ...] | None = field(default=None, repr=False, compare=False)
+    _content_markers_bytes: Tuple[bytes, ...] | None = field(default=None, repr=False, compare=False)
+    _fast_markers_bytes: Tuple[bytes, ...] = field(default=(), repr=False, compare=False)
+
+    def rebuild_patterns(self) -> None:
+        """
+        (Re)compile the URL-block matchers and content markers from current lists.
+
+        Blocked domains become a set of hosts, matched against the URL's
+        host and its parent domains ("x.com" blocks "api.x.com" but not
+        "box.com").  Entries with a path fall back to substring matching.
+        IGNORECASE dominates regex cost, so those entries and every pattern
+        without uppercase characters go into one case-sensitive regex that
+        is run against the lowercased URL.  Only the remaining patterns
+        are compiled with IGNORECASE.
+        """
+        hosts: list[str] = []
+        lower_parts: list[str] = []
+        for d in self.blocked_domains:
+            d = d.strip().lower()
+            if "/" in d:
+                lower_parts.append(re.escape(d))
+            elif d.strip("."):
+                hosts.append(d.strip("."))
+        self._blocked_hosts = frozenset(hosts)
+        ci_parts: list[str] = []
+        for p in self.skip_url_patterns:
+            (lower_parts if p == p.lower() else ci_parts).append(p)
+        self._compiled_url_pattern = re.compile(
+            "|".join(f"(?:{p})" for p in lower_parts) or "(?!)"
+        )
+        self._compiled_url_pattern_ci = re.compile(
+            "|".join(f"(?:{p})" for p in ci_parts), re.IGNORECASE
+        ) if ci_parts else None
+        # Content is lowercased before scanning, so markers must be too.
+        # Shortest first: generic markers ("captcha") hit most blocked pages
+        # and are cheapest, so any() short-circuits early.
+        self._content_markers = tuple(
+            sorted(dict.fromkeys(m.lower() for m in self.blocked_content_markers), key=len)
+        )
+        self._content_markers_bytes = tuple(m.encode("utf-8") for m in self._content_markers)
+        self._fast_markers_bytes = tuple(
+            variant
+            for marker, variants in _FAST_MARKER_VARIANTS.items()
+            if marker in self._content_markers
+            for variant in variants
+        )
 
     def is_blocked_url(self, url: str) -> bool:
         if self._compiled_url_pattern is None:
-            self.rebuild_url_pattern()
-        return bool(self._compiled_url_pattern.search(url))  # type: ignore[union-attr]
+            self.rebuild_patterns()
+        url_lower = url.lower()
+        blocked_hosts = self._blocked_hosts
+        if blocked_hosts:
+            # One set lookup per domain level: a.b.example.com, b.example.com, …
+            host = _url_host(url_lower)
+            while host:
+                if host in blocked_hosts:
+                    return True
+                host = host.partition(".")[2]
+        if self._compiled_url_pattern.search(url_lower):  # type: ignore[union-attr]
+            return True
+        ci = self._compiled_url_pattern_ci
+        return ci is not None and ci.search(url) is not None
 
     def is_blocked_content(self, content: str) -> bool:
         """Return True if content looks like a CAPTCHA or bot-block page."""
         if not content or len(content) < 30:
             return False
+        if self._content_markers is None:
+            self.rebuild_patterns()
         content_lower = content[:2000].lower()
-        return any(m in content_lower for m in self.blocked_content_markers)
+        return any(m in content_lower for m in self._content_markers)  # type: ignore[union-attr]
+
+    def is_blocked_content_bytes(self, buf: bytes | bytearray) -> bool:
+        """
+        Like is_blocked_content, but on the first CONTENT_SCAN_BYTES of an
+        undecoded body.  Uses ASCII case-folding, which covers the markers.
+        """
+        if len(buf) < 30:
+            return False
+        if self._content_markers_bytes is None:
+            self.rebuild_patterns()
+        # Fast path: no lowercased copy needed for the usual suspects
+        if any(buf.find(m, 0, CONTENT_SCAN_BYTES) != -1 for m in self._fast_markers_bytes):
+            return True
+        prefix = buf[:CONTENT_SCAN_BYTES].lower()
+        return any(m in prefix for m in self._content_markers_bytes)  # type: ignore[union-attr]
 
     def is_navigation_line(self, line: str) -> bool:
         line_lower = line.lower()
@@ -108,7 +200,7 @@ class FilterConfig:
 
 
 # ---------------------------------------------------------------------------
-# Singleton shared instance — mutated by MCP Resource writes
+# Singleton shared instance — swapped by MCP Resource writes
 # ---------------------------------------------------------------------------
 
 _shared_filter_config: FilterConfig | None = None
@@ -118,11 +210,11 @@ def get_filter_config() -> FilterConfig:
     global _shared_filter_config
     if _shared_filter_config is None:
         _shared_filter_config = FilterConfig()
-        _shared_filter_config.rebuild_url_pattern()
+        _shared_filter_config.rebuild_patterns()
     return _shared_filter_config
 
 
 def set_filter_config(cfg: FilterConfig) -> None:
     global _shared_filter_config
-    cfg.rebuild_url_pattern()
+    cfg.rebuild_patterns()
     _shared_filter_config = cfg
@@ -6,33 +6,33 @@ Output formatters: json (structured dict), raw (plain text), markdown.
 from __future__ import annotations
 
 import json
-from io import StringIO
 from typing import List
 
 from .config import FetchResult, ResearchStats
 
+# json.dumps() with non-default options builds a new encoder per call;
+# reuse one instead (C-accelerated since indent is unset)
+_NDJSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
 
 def format_json(results: List[FetchResult], stats: ResearchStats) -> dict:
     """Return structured dict suitable for direct MCP tool response."""
-    successful = [r for r in results if r.success]
     return {
         "query": stats.query,
         "stats": stats.to_dict(),
         "content": [
             {"url": r.url, "title": r.title, "content": r.content, "source": r.source}
-            for r in successful
+            for r in results if r.success
         ],
     }
 
 
 def format_raw(results: List[FetchResult]) -> str:
-    buf = StringIO()
+    parts: List[str] = []
     for r in results:
         if r.success:
-            buf.write(f"=== {r.url} ===\n")
-            buf.write(r.content)
-            buf.write("\n\n")
-    return buf.getvalue()
+            parts += ("=== ", r.url, " ===\n", r.content, "\n\n")
+    return "".join(parts)
 
 
 def format_markdown(
@@ -41,19 +41,21 @@ def format_markdown(
     max_preview: int = 4000,
 ) -> str:
     successful = [r for r in results if r.success]
-    buf = StringIO()
-    buf.write(f"# Research: {stats.query}\n\n")
-    buf.write(f"**Sources Analyzed**: {len(successful)} pages\n\n")
-    buf.write("---\n\n")
+    # Collect fragments and join once: a single allocation for the output
+    parts: List[str] = [
+        "# Research: ", stats.query, "\n\n",
+        "**Sources Analyzed**: ", str(len(successful)), " pages\n\n",
+        "---\n\n",
+    ]
     for r in successful:
         if r.content:
-            title = r.title or r.url
-            buf.write(f"## {title}\n")
-            buf.write(f"*Source: {r.url}*\n\n")
-            preview = r.content if len(r.content) <= max_preview else r.content[:max_preview] + "..."
-            buf.write(preview)
-            buf.write("\n\n---\n\n")
-    return buf.getvalue()
+            parts += ("## ", r.title or r.url, "\n*Source: ", r.url, "*\n\n")
+            if len(r.content) <= max_preview:
+                parts.append(r.content)
+            else:
+                parts += (r.content[:max_preview], "...")
+            parts.append("\n\n---\n\n")
+    return "".join(parts)
 
 
 def format_result_raw_single(result: FetchResult) -> str:
@@ -63,4 +65,4 @@ def format_result_raw_single(result: FetchResult) -> str:
 
 def format_result_json_single(result: FetchResult) -> str:
     """Single result as JSON line (NDJSON) for streaming."""
-    return json.dumps(result.to_dict(), ensure_ascii=False)
+    return _NDJSON_ENCODER.encode(result.to_dict())
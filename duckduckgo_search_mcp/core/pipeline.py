@@ -12,7 +12,6 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
 from typing import AsyncIterator, List, Optional
 
 from .config import FetchResult, ResearchConfig, ResearchStats
@@ -24,44 +23,46 @@ logger = logging.getLogger(__name__)
 
 async def run_pipeline(
     config: ResearchConfig,
+    stats: Optional[ResearchStats] = None,
 ) -> AsyncIterator[FetchResult]:
     """
     Async generator that yields FetchResult objects as they complete.
 
     Search and fetch run concurrently:
-      - search_producer: runs DDG (sync) in a thread, pushes URLs into fetch_queue
+      - search_producer: streams DDG results (sync DDGS in a worker thread) into fetch_queue
       - fetch_consumer:  reads fetch_queue, fans out async fetches up to semaphore limit
 
     Sentinel value None terminates each queue.
+
+    Pass *stats* to have the run's counters accumulated into it.
     """
-    stats = ResearchStats(query=config.query)
+    if stats is None:
+        stats = ResearchStats(query=config.query)
     fetch_queue: asyncio.Queue[Optional[str]] = asyncio.Queue()
     result_queue: asyncio.Queue[Optional[FetchResult]] = asyncio.Queue()
 
     async def search_producer() -> None:
-        loop = asyncio.get_event_loop()
         ddg = DuckDuckGoSearch()
-        urls: List[str] = []
-
-        def _search_sync() -> None:
-            for url, _title in ddg.search(config.query, config.search_results):
-                urls.append(url)
-                stats.urls_searched = len(urls)
-                loop.call_soon_threadsafe(fetch_queue.put_nowait, url)
-
-        with ThreadPoolExecutor(max_workers=1) as ex:
-            await loop.run_in_executor(ex, _search_sync)
-
-        await fetch_queue.put(None)  # signal end of search
+        try:
+            async for url, _title in ddg.search_async(
+                config.query, config.search_results, raise_errors=True,
+            ):
+                stats.urls_searched += 1
+                await fetch_queue.put(url)
+        except Exception:
+            stats.search_failed = True  # already logged by DuckDuckGoSearch
+        finally:
+            await fetch_queue.put(None)  # signal end of search
 
     async def fetch_consumer(client: "httpx.AsyncClient") -> None:  # type: ignore[name-defined]
         semaphore = asyncio.Semaphore(config.max_concurrent)
         fetch_limit = config.fetch_count  # 0 = unlimited
         session_ua = get_random_user_agent()
-        pending: List[asyncio.Task] = []
+        launched = 0
 
         async def fetch_one(url: str) -> None:
-            async with semaphore:
+            # Holds the slot acquired for it by the consumer loop below
+            try:
                 result = await fetch_single_async(
                     client, url,
                     config.timeout,
@@ -70,16 +71,26 @@ async def run_pipeline(
                     user_agent=session_ua,
                 )
                 await result_queue.put(result)
+            finally:
+                semaphore.release()
+
+        # A slot is taken *before* each task is created, so the loop stops
+        # pulling URLs while max_concurrent fetches are running: at most that
+        # many tasks exist, and the rest wait as plain strings in fetch_queue.
+        # Gating whole requests (not just bodies) also bounds the queue at the
+        # connection pool, whose wait counts against the request timeout.
+        # fetch_single_async never raises, so one failure cannot cancel the rest.
+        async with asyncio.TaskGroup() as tg:
+            while True:
+                url = await fetch_queue.get()
+                if url is None:
+                    break
+                if fetch_limit and launched >= fetch_limit:
+                    continue  # drain the rest so the producer's sentinel is seen
+                launched += 1
+                await semaphore.acquire()
+                tg.create_task(fetch_one(url))
 
-        while True:
-            url = await fetch_queue.get()
-            if url is None:
-                break
-            if fetch_limit == 0 or len(pending) < fetch_limit:
-                pending.append(asyncio.create_task(fetch_one(url)))
-
-        if pending:
-            await asyncio.gather(*pending, return_exceptions=True)
         await result_queue.put(None)  # signal end of fetch
 
     async with build_http_client(config.max_concurrent, config.timeout) as client:
@@ -110,15 +121,5 @@ async def collect_results(config: ResearchConfig) -> tuple[List[FetchResult], Re
     Returns (results_list, stats).
     """
     stats = ResearchStats(query=config.query)
-    results: List[FetchResult] = []
-
-    async for result in run_pipeline(config):
-        results.append(result)
-        if result.success:
-            stats.urls_fetched += 1
-            stats.content_chars += len(result.content)
-        else:
-            stats.urls_failed += 1
-
-    stats.urls_searched = len(results)
+    results = [result async for result in run_pipeline(config, stats)]
     return results, stats
@@ -21,12 +21,15 @@ Exposes:
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import functools
 import json
 import logging
 import os
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from mcp.server import Server
+from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.server.stdio import stdio_server
 from mcp.types import (
     CallToolResult,
@@ -36,22 +39,25 @@ from mcp.types import (
     ListToolsResult,
     Prompt,
     PromptMessage,
-    ReadResourceResult,
     Resource,
     TextContent,
     Tool,
 )
+from pydantic import AnyUrl
 
 from .core.cache import get_cache
+from .core.fetcher import close_shared_client
 from .core.filters import FilterConfig, get_filter_config, set_filter_config
 from .tools.fetch import handle_fetch_page
 from .tools.research import handle_research
 from .tools.search import handle_search_web
 
-logging.basicConfig(
-    level=getattr(logging, os.getenv("LOG_LEVEL", "WARNING").upper(), logging.WARNING),
-    format="%(levelname)s [%(name)s] %(message)s",
-)
+# Leave logging alone if the host process (or a re-import) already set it up
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=getattr(logging, os.getenv("LOG_LEVEL", "WARNING").upper(), logging.WARNING),
+        format="%(levelname)s [%(name)s] %(message)s",
+    )
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -98,12 +104,15 @@ One or two paragraph synthesis of the most important takeaways.
 - Source Name 2
 """
 
-try:
-    _template_path = os.path.join(_PROMPTS_DIR, "research_report.md")
-    with open(_template_path) as f:
-        _RESEARCH_REPORT_TEMPLATE = f.read()
-except FileNotFoundError:
-    pass  # use inline default above
+
+@functools.lru_cache(maxsize=1)
+def _load_template() -> str:
+    """Read the report template on first use rather than at import."""
+    try:
+        with open(os.path.join(_PROMPTS_DIR, "research_report.md")) as f:
+            return f.read()
+    except FileNotFoundError:
+        return _RESEARCH_REPORT_TEMPLATE  # use inline default above
 
 
 # ---------------------------------------------------------------------------
@@ -260,35 +269,7 @@ app = Server("duckduckgo-search-mcp")
 
 @app.list_tools()
 async def list_tools() -> ListToolsResult:
-    return ListToolsResult(tools=TOOLS)
-
-
-@app.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> CallToolResult:
-    try:
-        if name == "search_web":
-            result = await handle_search_web(arguments)
-        elif name == "fetch_page":
-            result = await handle_fetch_page(arguments)
-        elif name == "research":
-            # Wire up progress notifications as MCP log messages
-            async def _notify(msg: str) -> None:
-                # MCP log notification — clients that support it will display this
-                logger.info("PROGRESS: %s", msg)
-
-            result = await handle_research(arguments, notify_progress=_notify)
-        else:
-            result = {"error": f"Unknown tool: {name}"}
-
-        return CallToolResult(
-            content=[TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
-        )
-    except Exception as exc:
-        logger.exception("Tool %r raised: %s", name, exc)
-        return CallToolResult(
-            content=[TextContent(type="text", text=json.dumps({"error": str(exc)}))],
-            isError=True,
-        )
+    return _LIST_TOOLS_RESULT
 
 
 # ---------------------------------------------------------------------------
@@ -297,30 +278,49 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> CallToolResult:
 
 @app.list_resources()
 async def list_resources() -> ListResourcesResult:
-    return ListResourcesResult(resources=RESOURCES)
+    return _LIST_RESOURCES_RESULT
 
 
-@app.read_resource()
-async def read_resource(uri: str) -> ReadResourceResult:
+# Filter resources: URI → FilterConfig field.  Payloads are serialised once
+# per FilterConfig object; _update_filters always publishes a new object.
+_FILTER_RESOURCES = {
+    "filters://blocked-domains":   "blocked_domains",
+    "filters://skip-url-patterns": "skip_url_patterns",
+    "filters://blocked-content":   "blocked_content_markers",
+}
+_filter_payloads: dict[str, str] = {}
+_filter_payloads_config: FilterConfig | None = None
+
+
+def _read_filter_resource(uri: str) -> str:
+    global _filter_payloads_config
     filters = get_filter_config()
-    cache   = get_cache()
-
-    if uri == "filters://blocked-domains":
-        data = json.dumps(filters.blocked_domains, indent=2)
-    elif uri == "filters://skip-url-patterns":
-        data = json.dumps(filters.skip_url_patterns, indent=2)
-    elif uri == "filters://blocked-content":
-        data = json.dumps(filters.blocked_content_markers, indent=2)
-    elif uri == "cache://stats":
-        data = json.dumps({
-            "memory_entries": cache.memory_size,
-        }, indent=2)
-    else:
-        data = json.dumps({"error": f"Unknown resource: {uri}"})
+    if filters is not _filter_payloads_config:
+        _filter_payloads.clear()
+        _filter_payloads_config = filters
+    data = _filter_payloads.get(uri)
+    if data is None:
+        data = _filter_payloads[uri] = json.dumps(getattr(filters, _FILTER_RESOURCES[uri]))
+    return data
 
-    return ReadResourceResult(
-        contents=[TextContent(type="text", text=data)]
-    )
+
+def _read_cache_stats(uri: str) -> str:
+    return json.dumps({"memory_entries": get_cache().memory_size})
+
+
+_RESOURCE_HANDLERS: dict[str, Callable[[str], str]] = {
+    **dict.fromkeys(_FILTER_RESOURCES, _read_filter_resource),
+    "cache://stats": _read_cache_stats,
+}
+
+
+@app.read_resource()
+async def read_resource(uri: AnyUrl) -> list[ReadResourceContents]:
+    key = str(uri)  # the SDK passes a pydantic AnyUrl, which never == a str
+    handler = _RESOURCE_HANDLERS.get(key)
+    if handler is None:
+        raise ValueError(f"Unknown resource: {key}")
+    return [ReadResourceContents(content=handler(key), mime_type="application/json")]
 
 
 # MCP does not yet have a universal write_resource decorator in all SDK versions,
@@ -359,52 +359,95 @@ MANAGEMENT_TOOLS = [
 
 TOOLS.extend(MANAGEMENT_TOOLS)
 
+# Listings never change at runtime: build the result models once
+_LIST_TOOLS_RESULT     = ListToolsResult(tools=TOOLS)
+_LIST_RESOURCES_RESULT = ListResourcesResult(resources=RESOURCES)
 
-async def _handle_management(name: str, arguments: dict[str, Any]) -> dict:
-    if name == "_update_filters":
-        current = get_filter_config()
-        new_cfg = FilterConfig(
-            blocked_domains         = arguments.get("blocked_domains",         current.blocked_domains),
-            skip_url_patterns       = arguments.get("skip_url_patterns",       current.skip_url_patterns),
-            blocked_content_markers = arguments.get("blocked_content_markers", current.blocked_content_markers),
-            navigation_patterns     = arguments.get("navigation_patterns",     current.navigation_patterns),
-        )
-        set_filter_config(new_cfg)
-        return {"status": "ok", "message": "Filter config updated"}
 
-    elif name == "_cache_clear":
-        await get_cache().clear()
-        return {"status": "ok", "message": "Cache cleared"}
+_FILTER_FIELDS = frozenset({
+    "blocked_domains", "skip_url_patterns", "blocked_content_markers", "navigation_patterns",
+})
+
 
-    elif name == "_cache_stats":
-        c = get_cache()
-        return {"memory_entries": c.memory_size}
+async def _update_filters(arguments: dict[str, Any]) -> dict:
+    # Copy the current config with only the passed lists swapped in;
+    # set_filter_config recompiles the derived patterns
+    updates = {k: v for k, v in arguments.items() if k in _FILTER_FIELDS}
+    set_filter_config(dataclasses.replace(get_filter_config(), **updates))
+    return {"status": "ok", "message": "Filter config updated"}
 
-    return {"error": f"Unknown management tool: {name}"}
 
+async def _cache_clear(arguments: dict[str, Any]) -> dict:
+    await get_cache().clear()
+    return {"status": "ok", "message": "Cache cleared"}
 
-# Patch call_tool to also handle management tools
-_original_call_tool = call_tool.__wrapped__ if hasattr(call_tool, "__wrapped__") else None
+
+async def _cache_stats(arguments: dict[str, Any]) -> dict:
+    return {"memory_entries": get_cache().memory_size}
+
+
+# ---------------------------------------------------------------------------
+# Tool dispatch
+# ---------------------------------------------------------------------------
+
+# Compact output: without indent the C encoder is used, and clients parse
+# the JSON anyway.  Reused because json.dumps with options builds one per call.
+_RESPONSE_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+async def _notify(msg: str) -> None:
+    # MCP log notification — clients that support it will display this.
+    logger.info("PROGRESS: %s", msg)
+
+
+# Overlapping research calls share one process: at most RESEARCH_MAX_INFLIGHT
+# pipelines run at once, and calls beyond RESEARCH_QUEUE_CAP (running +
+# waiting) are refused instead of piling up
+RESEARCH_MAX_INFLIGHT = int(os.getenv("RESEARCH_MAX_INFLIGHT", "4"))
+RESEARCH_QUEUE_CAP    = int(os.getenv("RESEARCH_QUEUE_CAP",    "16"))
+
+_research_gate = asyncio.BoundedSemaphore(RESEARCH_MAX_INFLIGHT)
+_research_admitted = 0
+
+
+async def _research(arguments: dict[str, Any]) -> dict:
+    global _research_admitted
+    if _research_admitted >= RESEARCH_QUEUE_CAP:
+        return {"error": "server busy", "details": "too many research calls in progress; retry later"}
+
+    _research_admitted += 1
+    try:
+        async with _research_gate:
+            # Wire up progress notifications as MCP log messages.  At the
+            # default WARNING level none is passed, so research does not
+            # build or batch the per-page progress lines at all.
+            notify = _notify if logger.isEnabledFor(logging.INFO) else None
+            return await handle_research(arguments, notify_progress=notify)
+    finally:
+        _research_admitted -= 1
+
+
+_HANDLERS: dict[str, Callable[[dict[str, Any]], Awaitable[dict]]] = {
+    "search_web":      handle_search_web,
+    "fetch_page":      handle_fetch_page,
+    "research":        _research,
+    "_update_filters": _update_filters,
+    "_cache_clear":    _cache_clear,
+    "_cache_stats":    _cache_stats,
+}
 
 
 @app.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> CallToolResult:  # type: ignore[no-redef]
+async def call_tool(name: str, arguments: dict[str, Any]) -> CallToolResult:
     try:
-        if name == "search_web":
-            result = await handle_search_web(arguments)
-        elif name == "fetch_page":
-            result = await handle_fetch_page(arguments)
-        elif name == "research":
-            async def _notify(msg: str) -> None:
-                logger.info("PROGRESS: %s", msg)
-            result = await handle_research(arguments, notify_progress=_notify)
-        elif name.startswith("_"):
-            result = await _handle_management(name, arguments)
-        else:
+        handler = _HANDLERS.get(name)
+        if handler is None:
             result = {"error": f"Unknown tool: {name}"}
+        else:
+            result = await handler(arguments)
 
         return CallToolResult(
-            content=[TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
+            content=[TextContent(type="text", text=_RESPONSE_ENCODER.encode(result))]
         )
     except Exception as exc:
         logger.exception("Tool %r raised: %s", name, exc)
@@ -418,31 +461,41 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> CallToolResult:  #
 # Prompts
 # ---------------------------------------------------------------------------
 
+PROMPTS = [
+    Prompt(
+        name="research_report",
+        description=(
+            "Template and instructions for synthesising raw web research results "
+            "into a structured, well-cited markdown report."
+        ),
+    )
+]
+
+_LIST_PROMPTS_RESULT = ListPromptsResult(prompts=PROMPTS)
+
+
 @app.list_prompts()
 async def list_prompts() -> ListPromptsResult:
-    return ListPromptsResult(prompts=[
-        Prompt(
-            name="research_report",
-            description=(
-                "Template and instructions for synthesising raw web research results "
-                "into a structured, well-cited markdown report."
-            ),
-        )
-    ])
+    return _LIST_PROMPTS_RESULT
+
+
+@functools.lru_cache(maxsize=1)
+def _research_report_prompt() -> GetPromptResult:
+    return GetPromptResult(
+        description="Research report synthesis template",
+        messages=[
+            PromptMessage(
+                role="user",
+                content=TextContent(type="text", text=_load_template()),
+            )
+        ],
+    )
 
 
 @app.get_prompt()
 async def get_prompt(name: str, arguments: dict[str, str] | None = None) -> GetPromptResult:
     if name == "research_report":
-        return GetPromptResult(
-            description="Research report synthesis template",
-            messages=[
-                PromptMessage(
-                    role="user",
-                    content=TextContent(type="text", text=_RESEARCH_REPORT_TEMPLATE),
-                )
-            ],
-        )
+        return _research_report_prompt()
     raise ValueError(f"Unknown prompt: {name}")
 
 
@@ -452,16 +505,26 @@ async def get_prompt(name: str, arguments: dict[str, str] | None = None) -> GetP
 
 async def _serve() -> None:
     logger.info("Starting duckduckgo-search-mcp server")
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options(),
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options(),
+            )
+    finally:
+        await close_shared_client()
 
 
 def main() -> None:
-    asyncio.run(_serve())
+    # uvloop (libuv) has cheaper socket/TLS I/O than the default selector
+    # loop; it is not available on Windows.
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(_serve())
+    else:
+        uvloop.run(_serve())
 
 
 if __name__ == "__main__":
@@ -10,7 +10,15 @@ from __future__ import annotations
 
 from typing import Any
 
-from ..core.fetcher import build_http_client, fetch_single_async, get_random_user_agent
+from pydantic import ValidationError
+
+from ..core.config import FetchArgs, invalid_arguments
+from ..core.fetcher import (
+    fetch_single_async,
+    get_random_user_agent,
+    get_shared_body_semaphore,
+    get_shared_client,
+)
 
 
 async def handle_fetch_page(arguments: dict[str, Any]) -> dict:
@@ -25,22 +33,28 @@ async def handle_fetch_page(arguments: dict[str, Any]) -> dict:
     Returns FetchResult as dict:
         {url, success, title?, content?, error?}
     """
-    url = str(arguments.get("url", "")).strip()
+    try:
+        args = FetchArgs.model_validate(arguments)
+    except ValidationError as exc:
+        return invalid_arguments(exc)
+
+    url = args.url.strip()
     if not url:
         return {"error": "url is required"}
 
-    max_length = int(arguments.get("max_length", 5000))
-    timeout    = int(arguments.get("timeout", 20))
+    max_length = args.max_length
+    timeout    = args.timeout
 
     ua = get_random_user_agent()
 
-    async with build_http_client(max_concurrent=1, timeout=timeout) as client:
-        result = await fetch_single_async(
-            client, url,
-            timeout=timeout,
-            min_content_length=100,      # lenient for single-page fetch
-            max_content_length=max_length,
-            user_agent=ua,
-        )
+    result = await fetch_single_async(
+        get_shared_client(timeout),
+        url,
+        timeout=timeout,
+        min_content_length=100,      # lenient for single-page fetch
+        max_content_length=max_length,
+        user_agent=ua,
+        body_semaphore=get_shared_body_semaphore(),
+    )
 
     return result.to_dict()
@@ -11,19 +11,71 @@ Full search + fetch pipeline with:
 """
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
-from typing import Any, Callable, Awaitable, Optional
+import time
+from dataclasses import replace
+from typing import Any, Callable, Awaitable, List, Optional
+
+from pydantic import ValidationError
 
 from ..core.cache import get_cache, make_cache_key
-from ..core.config import ResearchConfig, ResearchStats
+from ..core.config import FetchResult, ResearchArgs, ResearchConfig, ResearchStats, invalid_arguments
 from ..core.formatters import format_json, format_raw, format_markdown
-from ..core.pipeline import collect_results
+from ..core.pipeline import run_pipeline
 
 logger = logging.getLogger(__name__)
 
 # Type for the optional MCP progress notification callback
 ProgressCallback = Optional[Callable[[str], Awaitable[None]]]
 
+# Per-page progress lines arriving within this window share one notification
+PROGRESS_FLUSH_INTERVAL = 0.1
+
+
+class ProgressBatcher:
+    """
+    Coalesce per-page progress lines into newline-joined notifications.
+
+    A line is sent straight away if nothing was sent in the last
+    *interval* seconds; lines arriving faster are buffered and go out
+    when that window closes, with the next send, or with the final
+    flush(), whichever comes first.  A slow trickle of pages is reported
+    without delay, while a burst costs one write per window and is not
+    held back behind a slow page.
+    """
+
+    def __init__(self, notify: Callable[[str], Awaitable[None]], interval: float = PROGRESS_FLUSH_INTERVAL) -> None:
+        self._notify = notify
+        self._interval = interval
+        self._pending: List[str] = []
+        self._last_sent = float("-inf")
+        self._timer: Optional[asyncio.Task] = None
+
+    async def add(self, line: str) -> None:
+        self._pending.append(line)
+        wait = self._last_sent + self._interval - time.monotonic()
+        if wait <= 0:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after(wait))
+
+    async def _flush_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._timer = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()  # sending now; the window restarts
+            self._timer = None
+        if self._pending:
+            message = "\n".join(self._pending)
+            self._pending.clear()
+            self._last_sent = time.monotonic()
+            await self._notify(message)
+
 
 async def handle_research(
     arguments: dict[str, Any],
@@ -50,20 +102,17 @@ async def handle_research(
           "content": [ {"url", "title", "content", "source"}, ... ]
         }
     """
-    query = str(arguments.get("query", "")).strip()
+    try:
+        args = ResearchArgs.model_validate(arguments)
+    except ValidationError as exc:
+        return invalid_arguments(exc)
+
+    query = args.query.strip()
     if not query:
         return {"error": "query is required"}
 
-    config = ResearchConfig(
-        query=query,
-        search_results  = int(arguments.get("search_results",     50)),
-        fetch_count     = int(arguments.get("fetch_count",          0)),
-        max_content_length = int(arguments.get("max_content_length", 5000)),
-        timeout         = int(arguments.get("timeout",              20)),
-        max_concurrent  = int(arguments.get("max_concurrent",       20)),
-        output_format   = str(arguments.get("output_format",     "json")),
-    )
-    use_cache = bool(arguments.get("use_cache", True))
+    config = ResearchConfig(query=query, **args.model_dump(exclude={"query", "use_cache"}))
+    use_cache = args.use_cache
 
     # Build cache key from all params that affect results
     cache_key = make_cache_key(
@@ -76,50 +125,79 @@ async def handle_research(
     cache = get_cache()
 
     # --- Cache read ---
+    # Entries hold the unformatted (results, stats); each hit is formatted
+    # for the caller, so one entry serves every output_format
     if use_cache:
         cached = await cache.get(cache_key)
         if cached is not None:
             logger.info("Returning cached result for %r", query)
-            cached["cached"] = True
-            return cached
-
-    # --- Progress notification: starting ---
-    if notify_progress:
-        await notify_progress(f'Starting research: "{query}"')
+            results, stats = cached
+            return _format_response(results, replace(stats, query=query), config, cached=True)
 
-    # --- Run pipeline ---
-    results, stats = await collect_results(config)
+    stats = ResearchStats(query=query)
+    results: List[FetchResult] = []
 
-    if notify_progress:
-        await notify_progress(
-            f"Fetched {stats.urls_fetched}/{stats.urls_searched} pages "
-            f"({stats.content_chars:,} chars)"
-        )
-
-    # --- Format output ---
-    output_format = config.output_format.lower()
+    # --- Negative cache: searches known to return nothing skip DDG ---
+    known_empty = use_cache and await cache.get_negative(cache_key)
+    if known_empty:
+        logger.info("Query %r recently returned no results", query)
+    else:
+        # --- Progress notification: starting ---
+        if notify_progress:
+            await notify_progress(f'Starting research: "{query}"')
+
+        # --- Run pipeline, reporting each page as it completes ---
+        progress = ProgressBatcher(notify_progress) if notify_progress else None
+        async for result in run_pipeline(config, stats):
+            # Failed pages appear in no output format: keep only the stats
+            if result.success:
+                results.append(result)
+            if progress:
+                await progress.add(json.dumps({"page": result.url, "chars": len(result.content)}))
+
+        if progress:
+            await progress.flush()
+            await notify_progress(
+                f"Fetched {stats.urls_fetched}/{stats.urls_searched} pages "
+                f"({stats.content_chars:,} chars)"
+            )
+
+        # --- Cache write ---
+        if use_cache:
+            if stats.urls_fetched > 0:
+                await cache.set(cache_key, (results, stats))
+            elif stats.urls_searched == 0 and not stats.search_failed:
+                # Only a search that completed and found nothing is
+                # remembered; rate limits and network errors are retried
+                await cache.set_negative(cache_key)
+
+    return _format_response(results, stats, config, cached=known_empty)
+
+
+def _format_response(
+    results: List[FetchResult],
+    stats: ResearchStats,
+    config: ResearchConfig,
+    cached: bool,
+) -> dict:
+    """Build the tool response in the requested output_format."""
+    output_format = config.output_format
 
     if output_format == "raw":
-        response: dict = {
-            "query": query,
-            "cached": False,
+        return {
+            "query": stats.query,
+            "cached": cached,
             "stats": stats.to_dict(),
             "content": format_raw(results),
         }
-    elif output_format == "markdown":
-        response = {
-            "query": query,
-            "cached": False,
+    if output_format == "markdown":
+        return {
+            "query": stats.query,
+            "cached": cached,
             "stats": stats.to_dict(),
             "content": format_markdown(results, stats, config.max_content_length),
         }
-    else:
-        # json (default) — structured, best for LLM consumption
-        response = format_json(results, stats)
-        response["cached"] = False
-
-    # --- Cache write ---
-    if use_cache and stats.urls_fetched > 0:
-        await cache.set(cache_key, response)
-
+    # json (default) — structured, best for LLM consumption
+    response = format_json(results, stats)
+    response["cached"] = cached
     return response
@@ -9,12 +9,16 @@ selectively call fetch_page on specific results.
 """
 from __future__ import annotations
 
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from pydantic import ValidationError
+
+from ..core.config import SearchArgs, invalid_arguments
 from ..core.ddg import DuckDuckGoSearch
 
+# DuckDuckGoSearch holds no per-search state; one instance serves all calls
+_ddg = DuckDuckGoSearch()
+
 
 async def handle_search_web(arguments: dict[str, Any]) -> dict:
     """
@@ -31,25 +35,24 @@ async def handle_search_web(arguments: dict[str, Any]) -> dict:
           "results": [ {"url": str, "title": str}, ... ]
         }
     """
-    query = str(arguments.get("query", "")).strip()
+    try:
+        args = SearchArgs.model_validate(arguments)
+    except ValidationError as exc:
+        return invalid_arguments(exc)
+
+    query = args.query.strip()
     if not query:
         return {"error": "query is required"}
 
-    num_results = int(arguments.get("num_results", 50))
-    num_results = max(1, min(num_results, 200))
-
-    ddg = DuckDuckGoSearch()
-    results = []
-
-    loop = asyncio.get_event_loop()
-
-    def _run_search() -> list:
-        return list(ddg.search(query, num_results))
-
-    with ThreadPoolExecutor(max_workers=1) as ex:
-        pairs = await loop.run_in_executor(ex, _run_search)
+    num_results = max(1, min(args.num_results, 200))
 
-    results = [{"url": url, "title": title} for url, title in pairs]
+    # Same path as the research pipeline: DDGS.text() returns its complete
+    # result list in an executor thread, which filters it and drains the
+    # pairs into an asyncio.Queue consumed here
+    results = [
+        {"url": url, "title": title}
+        async for url, title in _ddg.search_async(query, num_results)
+    ]
 
     return {
         "query": query,
@@ -1,7 +1,7 @@
 """Tests for core/cache.py"""
 import asyncio
 import pytest
-from duckduckgo_search_mcp.core.cache import _LRUCache, make_cache_key, ResearchCache
+from duckduckgo_search_mcp.core.cache import _LRUCache, make_cache_key, normalize_query, ResearchCache
 
 
 @pytest.mark.asyncio
@@ -80,3 +80,30 @@ async def test_research_cache_memory_only():
     await rc.clear()
     assert await rc.get("k") is None
     assert rc.memory_size == 0
+
+
+@pytest.mark.asyncio
+async def test_lru_hit_refreshes_recency():
+    cache = _LRUCache(max_size=3, ttl=60)
+    for i in range(3):
+        await cache.set(f"key{i}", i)
+    assert await cache.get("key0") == 0  # key0 becomes most recent
+    await cache.set("key3", 3)
+    assert await cache.get("key1") is None  # key1 was least recent
+    assert await cache.get("key0") == 0
+
+
+def test_cache_key_normalises_query():
+    assert normalize_query("  Python \t GIL ") == "python gil"
+    assert make_cache_key("  Python  GIL ", fetch_count=0) == make_cache_key("python gil", fetch_count=0)
+
+
+@pytest.mark.asyncio
+async def test_research_cache_negative():
+    rc = ResearchCache()
+    assert await rc.get_negative("k") is False
+    await rc.set_negative("k")
+    assert await rc.get_negative("k") is True
+    assert await rc.get("k") is None  # separate from positive entries
+    await rc.clear()
+    assert await rc.get_negative("k") is False
@@ -0,0 +1,33 @@
+"""Tests for core/config.py"""
+import pytest
+from pydantic import ValidationError
+from duckduckgo_search_mcp.core.config import FetchArgs, ResearchArgs, SearchArgs, invalid_arguments
+
+
+def test_research_args_defaults_and_coercion():
+    args = ResearchArgs.model_validate({"query": "q", "fetch_count": "5", "use_cache": "false"})
+    assert args.fetch_count == 5
+    assert args.use_cache is False
+    assert args.search_results == 50
+    assert args.output_format == "json"
+
+
+def test_research_args_rejects_bad_format_and_unknown_keys():
+    with pytest.raises(ValidationError) as info:
+        ResearchArgs.model_validate({"query": "q", "output_format": "html", "bogus": 1})
+    fields = {err["loc"][0] for err in info.value.errors()}
+    assert fields == {"output_format", "bogus"}
+
+
+def test_invalid_arguments_response():
+    with pytest.raises(ValidationError) as info:
+        SearchArgs.model_validate({"query": "q", "num_results": "many"})
+    response = invalid_arguments(info.value)
+    assert response["error"] == "Invalid arguments"
+    assert response["details"][0]["loc"] == ("num_results",)
+    assert "input" not in response["details"][0]
+
+
+def test_fetch_args_defaults():
+    args = FetchArgs.model_validate({"url": "https://example.com"})
+    assert (args.max_length, args.timeout) == (5000, 20)
@@ -0,0 +1,91 @@
+"""Tests for core/ddg.py"""
+import pytest
+from duckduckgo_search_mcp.core.ddg import (
+    DuckDuckGoSearch,
+    _BloomFilter,
+    _canonicalize,
+    _is_valid_url,
+)
+
+
+def test_bloom_add_contains():
+    bloom = _BloomFilter(capacity=100)
+    assert "https://a.com/" not in bloom
+    bloom.add("https://a.com/")
+    assert "https://a.com/" in bloom
+
+
+def test_bloom_no_false_negatives():
+    bloom = _BloomFilter(capacity=400)
+    urls = [f"https://example.com/article/{i}" for i in range(400)]
+    for url in urls:
+        bloom.add(url)
+    assert all(url in bloom for url in urls)
+
+
+def test_bloom_false_positive_rate():
+    bloom = _BloomFilter(capacity=400, error_rate=1e-4)
+    for i in range(400):
+        bloom.add(f"https://seen.com/{i}")
+    false_positives = sum(f"https://unseen.com/{i}" in bloom for i in range(10000))
+    assert false_positives < 10
+
+
+def test_is_valid_url():
+    assert _is_valid_url("https://example.com/a") is True
+    assert _is_valid_url("http://example.com") is True
+    assert _is_valid_url("ftp://example.com/a") is False
+    assert _is_valid_url("https:///path") is False
+    assert _is_valid_url("") is False
+    assert _is_valid_url("not a url") is False
+
+
+def test_canonicalize_drops_fragment():
+    assert _canonicalize("https://x.com/a#frag") == _canonicalize("https://x.com/a")
+
+
+def test_canonicalize_sorts_query():
+    assert _canonicalize("https://x.com/a?b=1&a=2") == "https://x.com/a?a=2&b=1"
+
+
+def test_canonicalize_host_and_port():
+    assert _canonicalize("HTTPS://X.com:443/a/") == "https://x.com/a"
+    assert _canonicalize("http://x.com:8080/a") == "http://x.com:8080/a"
+
+
+def test_canonicalize_root_path():
+    assert _canonicalize("https://x.com") == "https://x.com/"
+    assert _canonicalize("https://x.com/") == "https://x.com/"
+
+
+def test_canonicalize_keeps_distinct_paths():
+    assert _canonicalize("https://x.com/a") != _canonicalize("https://x.com/b")
+
+
+@pytest.mark.asyncio
+async def test_search_async_streams_sync_results(monkeypatch):
+    pairs = [(f"https://example.com/{i}", f"Title {i}") for i in range(5)]
+    monkeypatch.setattr(DuckDuckGoSearch, "search", lambda self, q, n, raise_errors=False: iter(pairs))
+    got = [p async for p in DuckDuckGoSearch().search_async("q", 5)]
+    assert got == pairs
+
+
+@pytest.mark.asyncio
+async def test_search_async_early_exit(monkeypatch):
+    pairs = [(f"https://example.com/{i}", "") for i in range(50)]
+    monkeypatch.setattr(DuckDuckGoSearch, "search", lambda self, q, n, raise_errors=False: iter(pairs))
+    async for url, _title in DuckDuckGoSearch().search_async("q", 50):
+        break
+    assert url == "https://example.com/0"
+
+
+def test_ddgs_client_reused_per_thread():
+    import threading
+    from duckduckgo_search_mcp.core.ddg import _get_ddgs
+
+    assert _get_ddgs() is _get_ddgs()
+    other = []
+    worker = threading.Thread(target=lambda: other.append(_get_ddgs()))
+    worker.start()
+    worker.join()
+    assert other[0] is not _get_ddgs()
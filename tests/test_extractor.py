@@ -1,6 +1,10 @@
 """Tests for core/extractor.py"""
 import pytest
-from duckduckgo_search_mcp.core.extractor import extract_text, extract_title_from_content, clean_text
+from duckduckgo_search_mcp.core import extractor
+from duckduckgo_search_mcp.core.extractor import (
+    clean_text, extract_page, extract_text, extract_title_from_content,
+)
+from duckduckgo_search_mcp.core.filters import FilterConfig, get_filter_config, set_filter_config
 
 
 def test_extract_title():
@@ -11,6 +15,13 @@ def test_extract_title():
     assert "Site Name" not in result.split("\n")[0]
 
 
+def test_duplicate_title_line_dropped():
+    body = "<p>Hello world, this is a test paragraph with enough content to be kept.</p>"
+    for title in ("My Page | Site Name", "My Page  |  Site Name"):
+        result = extract_text(f"<title>{title}</title>\n<h1>My Page - Other Site</h1>{body}")
+        assert result.split("\n")[:3] == ["# My Page", "", "My Page - Other Site"]
+
+
 def test_strips_script_and_style():
     html = """
     <html><body>
@@ -25,6 +36,20 @@ def test_strips_script_and_style():
     assert "actual content" in result
 
 
+def test_comment_containing_script_tag():
+    html = """
+    <html><body>
+    <!-- <script> legacy include -->
+    <p>This paragraph sits between a commented-out tag and a real script block.</p>
+    <script>var y = 2;</script>
+    </body></html>
+    """
+    result = extract_text(html)
+    assert "between a commented-out tag" in result
+    assert "var y" not in result
+    assert "legacy include" not in result
+
+
 def test_strips_nav_and_footer():
     html = """
     <html><body>
@@ -39,6 +64,43 @@ def test_strips_nav_and_footer():
     assert "article paragraph" in result
 
 
+def test_ui_fragment_check_uses_islower():
+    # "º" is lowercase with no uppercase form; "ǅ" is titlecase, not lowercase
+    html = (
+        "<p>Nº 5</p><p>MENU</p><p>ǅ</p>"
+        "<p>This is a long enough article paragraph that should survive filtering.</p>"
+    )
+    assert extract_text(html).split("\n")[0] == "Nº 5"
+    assert "MENU" not in extract_text(html) and "ǅ" not in extract_text(html)
+
+
+def test_extract_memo_invalidated_on_filter_change():
+    html = (
+        "<p>Read more about this topic in the long paragraph that follows here.</p>"
+        "<p>This is a long enough article paragraph that should survive filtering.</p>"
+    )
+    body = html.encode()
+    original = get_filter_config()
+    assert "Read more" in extract_page(body, "utf-8")
+    assert extract_page(body, "utf-8") == extract_text(html)
+    try:
+        set_filter_config(FilterConfig(navigation_patterns=["read more"]))
+        assert "Read more" not in extract_page(body, "utf-8")
+    finally:
+        set_filter_config(original)
+
+
+def test_extract_memo_bounded_by_total_chars(monkeypatch):
+    monkeypatch.setattr(extractor, "EXTRACT_CACHE_MAX_CHARS", 500)
+    monkeypatch.setattr(extractor, "_extract_cache", {})
+    monkeypatch.setattr(extractor, "_extract_cache_chars", 0)
+    for i in range(10):
+        extract_page(f"<p>Page {i}: {'long enough paragraph text ' * 4}</p>".encode(), "utf-8")
+        assert extractor._extract_cache_chars <= 500
+    assert extractor._extract_cache_chars == sum(map(len, extractor._extract_cache.values()))
+    assert 0 < len(extractor._extract_cache) < 10
+
+
 def test_extract_title_from_content():
     content = "# My Title\n\nSome content here."
     assert extract_title_from_content(content) == "My Title"
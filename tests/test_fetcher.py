@@ -0,0 +1,122 @@
+"""Tests for core/fetcher.py"""
+import asyncio
+import gzip
+
+import httpx
+import pytest
+from duckduckgo_search_mcp.core.fetcher import (
+    MAX_CONTENT_BYTES,
+    USER_AGENTS,
+    _make_fetch_result,
+    fetch_single_async,
+    get_random_user_agent,
+)
+
+ARTICLE = (
+    "<html><head><title>Article</title></head><body>"
+    + "<p>This paragraph is long enough to survive the extractor line filters.</p>" * 20
+    + "</body></html>"
+)
+
+
+def _client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+async def _fetch(handler, url: str = "https://example.com/a"):
+    async with _client(handler) as client:
+        return await fetch_single_async(client, url, 5, 100, 5000)
+
+
+def test_user_agent_rotation_covers_all():
+    seen = {get_random_user_agent() for _ in range(len(USER_AGENTS))}
+    assert seen == set(USER_AGENTS)
+
+
+def test_fetch_result_keeps_long_title():
+    title = "Long title " * 50
+    result = _make_fetch_result("https://example.com/", f"# {title}\n\nBody", "direct", 10, 5000)
+    assert result.title == title
+
+
+@pytest.mark.asyncio
+async def test_fetch_success():
+    result = await _fetch(lambda req: httpx.Response(200, html=ARTICLE))
+    assert result.success is True
+    assert result.title == "Article"
+    assert "long enough" in result.content
+
+
+@pytest.mark.asyncio
+async def test_fetch_http_error():
+    result = await _fetch(lambda req: httpx.Response(404))
+    assert result.success is False
+    assert result.error == "HTTP 404"
+
+
+@pytest.mark.asyncio
+async def test_fetch_captcha_in_prefix():
+    page = "<html><body>Please verify you are human.</body></html>" + " " * 20000
+    result = await _fetch(lambda req: httpx.Response(200, html=page))
+    assert result.success is False
+    assert result.error == "CAPTCHA/blocked"
+
+
+@pytest.mark.asyncio
+async def test_fetch_oversized_body_is_capped():
+    body = ARTICLE.encode() + b"x" * (MAX_CONTENT_BYTES + 100_000)
+
+    async def stream():
+        for i in range(0, len(body), 65536):
+            yield body[i:i + 65536]
+
+    result = await _fetch(lambda req: httpx.Response(200, content=stream()))
+    assert result.success is True
+
+
+@pytest.mark.asyncio
+async def test_fetch_declared_oversized_rejected():
+    headers = {"content-length": str(MAX_CONTENT_BYTES + 1)}
+    result = await _fetch(lambda req: httpx.Response(200, headers=headers, content=b"x"))
+    assert result.success is False
+    assert result.error == "Content too large"
+
+
+@pytest.mark.asyncio
+async def test_fetch_decodes_declared_charset():
+    page = ARTICLE.replace("Article", "Café")
+    result = await _fetch(
+        lambda req: httpx.Response(
+            200,
+            headers={"content-type": "text/html; charset=latin-1"},
+            content=page.encode("latin-1"),
+        )
+    )
+    assert result.title == "Café"
+
+
+@pytest.mark.asyncio
+async def test_fetch_advertises_and_decodes_compression():
+    def handler(req):
+        assert "br" in req.headers["accept-encoding"]
+        return httpx.Response(
+            200,
+            headers={"content-type": "text/html", "content-encoding": "gzip"},
+            content=gzip.compress(ARTICLE.encode()),
+        )
+
+    result = await _fetch(handler)
+    assert result.success is True
+    assert result.title == "Article"
+
+
+@pytest.mark.asyncio
+async def test_fetch_releases_body_semaphore():
+    sem = asyncio.Semaphore(1)
+    async with _client(lambda req: httpx.Response(200, html=ARTICLE)) as client:
+        for _ in range(2):
+            result = await fetch_single_async(
+                client, "https://example.com/a", 5, 100, 5000, body_semaphore=sem,
+            )
+            assert result.success is True
+    assert not sem.locked()
@@ -5,7 +5,7 @@ from duckduckgo_search_mcp.core.filters import FilterConfig, get_filter_config
 
 def make_cfg() -> FilterConfig:
     cfg = FilterConfig()
-    cfg.rebuild_url_pattern()
+    cfg.rebuild_patterns()
     return cfg
 
 
@@ -32,14 +32,59 @@ def test_captcha_detection():
     assert cfg.is_blocked_content(normal_html)  is False
 
 
+def test_custom_content_marker_is_case_insensitive():
+    cfg = make_cfg()
+    cfg.blocked_content_markers.append("Access Restricted")
+    cfg.rebuild_patterns()
+    assert cfg.is_blocked_content("Sorry, access restricted for your region today.") is True
+
+
+def test_captcha_detection_bytes():
+    cfg = make_cfg()
+    assert cfg.is_blocked_content_bytes(b"<p>Cloudflare Ray ID: 8a1b2c3d4e5f</p>") is True
+    assert cfg.is_blocked_content_bytes(b"<p>Welcome to our website. Here is the article.</p>") is False
+    assert cfg.is_blocked_content_bytes(b"captcha") is False  # too short to judge
+
+
+def test_fast_markers_follow_config():
+    cfg = make_cfg()
+    page = b"<html><body>Please solve the CAPTCHA to continue browsing.</body></html>"
+    assert cfg.is_blocked_content_bytes(page) is True
+    cfg.blocked_content_markers.remove("captcha")
+    cfg.rebuild_patterns()
+    assert cfg.is_blocked_content_bytes(page) is False
+
+
 def test_custom_domain_blocking():
     cfg = make_cfg()
     cfg.blocked_domains.append("example.com")
-    cfg.rebuild_url_pattern()
+    cfg.rebuild_patterns()
     assert cfg.is_blocked_url("https://example.com/anything") is True
     assert cfg.is_blocked_url("https://other.com/anything") is False
 
 
+def test_domain_blocking_matches_hosts_not_substrings():
+    cfg = make_cfg()
+    assert cfg.is_blocked_url("https://mobile.twitter.com/user") is True
+    assert cfg.is_blocked_url("https://user:pw@x.com:8443/status") is True
+    assert cfg.is_blocked_url("https://box.com/files") is False
+    assert cfg.is_blocked_url("https://example.com/?ref=reddit.com") is False
+    cfg.blocked_domains.append("example.org/blog")  # path entries: substring match
+    cfg.rebuild_patterns()
+    assert cfg.is_blocked_url("https://example.org/blog/post") is True
+    assert cfg.is_blocked_url("https://example.org/about") is False
+
+
+def test_url_matching_is_case_insensitive():
+    cfg = make_cfg()
+    assert cfg.is_blocked_url("https://WWW.Reddit.COM/r/python") is True
+    assert cfg.is_blocked_url("https://example.com/Category/tech") is True
+    cfg.skip_url_patterns.append(r"/Private/\d+")
+    cfg.rebuild_patterns()
+    assert cfg.is_blocked_url("https://example.com/private/42") is True
+    assert cfg.is_blocked_url("https://example.com/private/x") is False
+
+
 def test_empty_content_not_blocked():
     cfg = make_cfg()
     assert cfg.is_blocked_content("") is False
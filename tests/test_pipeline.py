@@ -0,0 +1,79 @@
+"""Tests for core/pipeline.py"""
+import asyncio
+import pytest
+from duckduckgo_search_mcp.core import pipeline
+from duckduckgo_search_mcp.core.config import FetchResult, ResearchConfig
+
+
+@pytest.fixture
+def fake_search_fetch(monkeypatch):
+    urls = [f"https://example.com/{i}" for i in range(8)]
+    fetched = []
+
+    async def fake_search_async(self, query, num_results, raise_errors=False):
+        for url in urls:
+            yield url, ""
+
+    async def fake_fetch(client, url, *args, **kwargs):
+        fetched.append(url)
+        if url.endswith("/3"):
+            return FetchResult(url=url, success=False, error="HTTP 404")
+        return FetchResult(url=url, success=True, content="x" * 10)
+
+    monkeypatch.setattr(pipeline.DuckDuckGoSearch, "search_async", fake_search_async)
+    monkeypatch.setattr(pipeline, "fetch_single_async", fake_fetch)
+    return urls, fetched
+
+
+@pytest.mark.asyncio
+async def test_pipeline_fetches_all(fake_search_fetch):
+    urls, fetched = fake_search_fetch
+    results = [r async for r in pipeline.run_pipeline(ResearchConfig(query="q"))]
+    assert sorted(r.url for r in results) == sorted(urls)
+    assert sorted(fetched) == sorted(urls)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_fetch_count_caps_total(fake_search_fetch):
+    urls, fetched = fake_search_fetch
+    config = ResearchConfig(query="q", fetch_count=3, max_concurrent=2)
+    results = [r async for r in pipeline.run_pipeline(config)]
+    assert len(results) == 3
+    assert fetched == urls[:3]
+
+
+@pytest.mark.asyncio
+async def test_collect_results_stats(fake_search_fetch):
+    urls, _ = fake_search_fetch
+    results, stats = await pipeline.collect_results(ResearchConfig(query="q"))
+    assert len(results) == len(urls)
+    assert stats.urls_searched == len(urls)
+    assert stats.urls_fetched == len(urls) - 1
+    assert stats.urls_failed == 1
+    assert stats.content_chars == 10 * (len(urls) - 1)
+
+
+@pytest.mark.asyncio
+async def test_fetch_consumer_applies_back_pressure(monkeypatch):
+    urls = [f"https://example.com/{i}" for i in range(20)]
+    peak_tasks = 0
+
+    async def fake_search_async(self, query, num_results, raise_errors=False):
+        for url in urls:
+            yield url, ""
+
+    async def slow_fetch(client, url, *args, **kwargs):
+        nonlocal peak_tasks
+        live = sum(
+            t.get_coro().__name__ == "fetch_one" for t in asyncio.all_tasks() if not t.done()
+        )
+        peak_tasks = max(peak_tasks, live)
+        await asyncio.sleep(0.01)
+        return FetchResult(url=url, success=True, content="x")
+
+    monkeypatch.setattr(pipeline.DuckDuckGoSearch, "search_async", fake_search_async)
+    monkeypatch.setattr(pipeline, "fetch_single_async", slow_fetch)
+    config = ResearchConfig(query="q", max_concurrent=3)
+    results = [r async for r in pipeline.run_pipeline(config)]
+    assert len(results) == len(urls)
+    assert peak_tasks <= 3  # pending URLs never become waiting tasks
@@ -0,0 +1,124 @@
+"""Tests for tools/research.py"""
+import asyncio
+import pytest
+from duckduckgo_search_mcp.core import cache as cache_module
+from duckduckgo_search_mcp.core import ddg
+from duckduckgo_search_mcp.core.config import FetchResult
+from duckduckgo_search_mcp.tools import research
+from duckduckgo_search_mcp.tools.research import ProgressBatcher, handle_research
+
+
+class FakeDDGS:
+    """Stands in for ddgs.DDGS: counts text() calls, returns or raises *outcome*."""
+
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.calls = 0
+
+    def text(self, query, max_results):
+        self.calls += 1
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+@pytest.fixture
+def fake_pipeline(monkeypatch):
+    runs = []
+
+    async def run_pipeline(config, stats):
+        runs.append(config)
+        stats.urls_searched = stats.urls_fetched = 1
+        stats.content_chars = 12
+        yield FetchResult(url="https://example.com/", success=True, content="# Page\n\nBody")
+
+    monkeypatch.setattr(research, "run_pipeline", run_pipeline)
+    return runs
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(cache_module, "_cache", None)
+
+
+def use_fake_ddgs(monkeypatch, outcome) -> FakeDDGS:
+    fake = FakeDDGS(outcome)
+    monkeypatch.setattr(ddg, "_get_ddgs", lambda: fake)
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_empty_search_is_negative_cached(monkeypatch, fresh_cache):
+    fake = use_fake_ddgs(monkeypatch, [])
+    first = await handle_research({"query": "nothing here"})
+    second = await handle_research({"query": "Nothing  Here"})
+    assert first["cached"] is False and first["content"] == []
+    assert second["cached"] is True and second["content"] == []
+    assert fake.calls == 1  # second call skipped DDG
+
+
+@pytest.mark.asyncio
+async def test_search_error_is_not_negative_cached(monkeypatch, fresh_cache):
+    fake = use_fake_ddgs(monkeypatch, RuntimeError("Ratelimit 202"))
+    first = await handle_research({"query": "rate limited"})
+    second = await handle_research({"query": "rate limited"})
+    assert first["content"] == [] and first["cached"] is False
+    assert second["cached"] is False
+    assert fake.calls == 2  # the failed search is retried
+
+
+@pytest.mark.asyncio
+async def test_progress_batcher_coalesces_bursts():
+    sent = []
+
+    async def notify(msg):
+        sent.append(msg)
+
+    batcher = ProgressBatcher(notify, interval=60)
+    for i in range(5):
+        await batcher.add(f"page {i}")
+    assert sent == ["page 0"]  # first line goes out immediately
+    await batcher.flush()
+    assert sent == ["page 0", "page 1\npage 2\npage 3\npage 4"]
+    await batcher.flush()
+    assert len(sent) == 2  # nothing pending
+
+
+@pytest.mark.asyncio
+async def test_progress_batcher_sends_pending_when_window_closes():
+    sent = []
+
+    async def notify(msg):
+        sent.append(msg)
+
+    batcher = ProgressBatcher(notify, interval=0.05)
+    for i in range(3):
+        await batcher.add(f"page {i}")
+    assert sent == ["page 0"]
+    await asyncio.sleep(0.1)  # no further lines: the timer sends the burst
+    assert sent == ["page 0", "page 1\npage 2"]
+    await batcher.flush()
+    assert len(sent) == 2
+
+
+@pytest.mark.asyncio
+async def test_progress_batcher_no_interval_sends_each_line():
+    sent = []
+
+    async def notify(msg):
+        sent.append(msg)
+
+    batcher = ProgressBatcher(notify, interval=0)
+    for i in range(3):
+        await batcher.add(f"page {i}")
+    assert sent == ["page 0", "page 1", "page 2"]
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_is_formatted_for_each_output_format(fake_pipeline, fresh_cache):
+    first = await handle_research({"query": "formats", "output_format": "json"})
+    second = await handle_research({"query": "formats", "output_format": "markdown"})
+    assert first["cached"] is False and isinstance(first["content"], list)
+    assert second["cached"] is True
+    assert isinstance(second["content"], str) and "https://example.com/" in second["content"]
+    assert len(fake_pipeline) == 1  # served from the json run's entry
@@ -0,0 +1,111 @@
+"""Tests for server.py"""
+import asyncio
+import json
+import logging
+import pytest
+from mcp import types
+from duckduckgo_search_mcp import server
+from duckduckgo_search_mcp.core.filters import get_filter_config, set_filter_config
+
+
+async def read_resource(uri: str) -> types.TextResourceContents:
+    handler = server.app.request_handlers[types.ReadResourceRequest]
+    request = types.ReadResourceRequest(
+        method="resources/read", params=types.ReadResourceRequestParams(uri=uri),
+    )
+    response = await handler(request)
+    (contents,) = response.root.contents
+    return contents
+
+
+@pytest.fixture
+def restore_filters():
+    original = get_filter_config()
+    yield
+    set_filter_config(original)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("resource", server.RESOURCES, ids=lambda r: str(r.uri))
+async def test_read_every_listed_resource(resource):
+    contents = await read_resource(str(resource.uri))
+    assert contents.mimeType == "application/json"
+    json.loads(contents.text)
+
+
+@pytest.mark.asyncio
+async def test_read_filter_resource_returns_list():
+    contents = await read_resource("filters://blocked-domains")
+    assert json.loads(contents.text) == get_filter_config().blocked_domains
+
+
+@pytest.mark.asyncio
+async def test_read_unknown_resource_raises():
+    with pytest.raises(ValueError, match="Unknown resource"):
+        await read_resource("filters://nope")
+
+
+@pytest.mark.asyncio
+async def test_filter_payload_rebuilt_after_update(restore_filters):
+    before = json.loads((await read_resource("filters://blocked-domains")).text)
+    assert "example.org" not in before
+    await server._update_filters({"blocked_domains": ["example.org"]})
+    after = await read_resource("filters://blocked-domains")
+    assert json.loads(after.text) == ["example.org"]
+
+
+@pytest.fixture
+def research_limits(monkeypatch):
+    monkeypatch.setattr(server, "RESEARCH_QUEUE_CAP", 3)
+    monkeypatch.setattr(server, "_research_gate", asyncio.BoundedSemaphore(2))
+
+
+@pytest.mark.asyncio
+async def test_research_rejects_calls_beyond_queue_cap(monkeypatch, research_limits):
+    release = asyncio.Event()
+
+    async def blocked_research(arguments, notify_progress=None):
+        await release.wait()
+        return {"query": arguments["query"]}
+
+    monkeypatch.setattr(server, "handle_research", blocked_research)
+    calls = [asyncio.create_task(server._research({"query": str(i)})) for i in range(3)]
+    while server._research_admitted < 3:
+        await asyncio.sleep(0)
+    assert await server._research({"query": "extra"}) == {
+        "error": "server busy", "details": "too many research calls in progress; retry later",
+    }
+    release.set()
+    assert [r["query"] for r in await asyncio.gather(*calls)] == ["0", "1", "2"]
+    assert server._research_admitted == 0
+
+
+@pytest.mark.asyncio
+async def test_research_admission_released_on_error(monkeypatch, research_limits):
+    async def failing_research(arguments, notify_progress=None):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(server, "handle_research", failing_research)
+    for _ in range(4):  # more than the cap: each failure gives its slot back
+        with pytest.raises(RuntimeError):
+            await server._research({"query": "q"})
+    assert server._research_admitted == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("level, notified", [(logging.WARNING, False), (logging.INFO, True)])
+async def test_research_progress_only_when_info_enabled(monkeypatch, level, notified):
+    seen = []
+
+    async def fake_research(arguments, notify_progress=None):
+        seen.append(notify_progress)
+        return {}
+
+    monkeypatch.setattr(server, "handle_research", fake_research)
+    original = server.logger.level
+    server.logger.setLevel(level)
+    try:
+        await server._research({"query": "q"})
+    finally:
+        server.logger.setLevel(original)
+    assert (seen[0] is not None) is notified